@@ -31,11 +31,11 @@ def main():
     
     with col1:
         st.subheader("上传送货明细")
-        delivery_file = st.file_uploader("选择送货明细Excel文件", type=['xlsx', 'xls'])
+        delivery_file = st.file_uploader("选择送货明细文件（Excel/CSV）", type=['xlsx', 'xls', 'csv'])
 
     with col2:
         st.subheader("上传价格表")
-        price_file = st.file_uploader("选择价格表Excel文件", type=['xlsx', 'xls'])
+        price_file = st.file_uploader("选择价格表文件（Excel/CSV）", type=['xlsx', 'xls', 'csv'])
 
     if delivery_file is not None and price_file is not None:
         try:
@@ -55,6 +55,7 @@ def main():
                 # 解析文件
                 delivery_df = parser.parse_delivery_file(delivery_path)
                 price_df = parser.parse_price_file(price_path)
+                st.caption(f"读取引擎：送货明细 {parser.engines['delivery']}，价格表 {parser.engines['price']}")
 
                 # 验证数据
                 delivery_valid, delivery_errors = validator.validate_delivery_data(delivery_df)
@@ -1,5 +1,6 @@
 from .excel_parser import ExcelParser
-from .price_matcher import PriceMatcher
+from .readers import TableReader
+from .price_matcher import PriceMatcher, PriceIndex
 from .validator import DataValidator
 
-__all__ = ['ExcelParser', 'PriceMatcher', 'DataValidator']
\ No newline at end of file
+__all__ = ['ExcelParser', 'TableReader', 'PriceMatcher', 'PriceIndex', 'DataValidator']
\ No newline at end of file
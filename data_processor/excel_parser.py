@@ -3,11 +3,15 @@ from typing import Dict, List, Optional
 from datetime import datetime
 from ..utils.logger import logger
 from ..utils.config import config
+from .readers import TableReader
 
 class ExcelParser:
     def __init__(self):
         self.price_config = config.price_template_config
         self.delivery_config = config.delivery_template_config
+        self.reader = TableReader()
+        # 记录每类文件最近一次读取所用的引擎，键为 'price' / 'delivery'
+        self.engines: Dict[str, str] = {}
 
     def parse_price_file(self, file_path: str) -> pd.DataFrame:
         """解析价格表文件"""
@@ -15,8 +19,8 @@ class ExcelParser:
             sheet_name = self.price_config.get('sheet_name', '价格表')
             required_fields = self.price_config.get('required_fields', [])
             
-            # 读取Excel文件
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
+            # 读取文件（自动选择最快的可用引擎）
+            df, self.engines['price'] = self.reader.read(file_path, sheet_name)
             
             # 验证必需字段
             missing_fields = [field for field in required_fields if field not in df.columns]
@@ -43,8 +47,8 @@ class ExcelParser:
             sheet_name = self.delivery_config.get('sheet_name', '送货明细')
             required_fields = self.delivery_config.get('required_fields', [])
             
-            # 读取Excel文件
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
+            # 读取文件（自动选择最快的可用引擎）
+            df, self.engines['delivery'] = self.reader.read(file_path, sheet_name)
             
             # 验证必需字段
             missing_fields = [field for field in required_fields if field not in df.columns]
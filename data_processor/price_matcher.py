@@ -1,22 +1,59 @@
+import numpy as np
 import pandas as pd
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Union
 from ..utils.logger import logger
 
+class PriceIndex:
+    """预编译的价格索引，构建一次后可在多个送货明细间复用（可pickle）"""
+
+    def __init__(self, price_df: pd.DataFrame):
+        # 与 set_index().to_dict() 保持一致：重复编码以最后一条为准，空编码忽略
+        price_df = price_df.dropna(subset=['商品编码'])
+        price_df = price_df.drop_duplicates(subset=['商品编码'], keep='last')
+
+        # 去重后的商品编码作为哈希索引，单价按相同位置存为连续的float数组
+        self.codes = pd.Index(price_df['商品编码'])
+        self.prices = np.ascontiguousarray(
+            pd.to_numeric(price_df['单价'], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+        )
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def lookup(self, codes: pd.Series) -> pd.Series:
+        """按商品编码批量查找单价，未匹配的返回NaN"""
+        if len(self.codes) == 0:
+            return pd.Series(np.nan, index=codes.index, name='单价')
+        positions = self.codes.get_indexer(codes)
+        prices = np.take(self.prices, positions, mode='clip')
+        prices = np.where(positions >= 0, prices, np.nan)
+        return pd.Series(prices, index=codes.index, name='单价')
+
 class PriceMatcher:
     def __init__(self):
         pass
 
-    def match_prices(self, delivery_df: pd.DataFrame, price_df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
-        """匹配送货明细和价格表数据"""
+    def build_index(self, price_df: pd.DataFrame) -> PriceIndex:
+        """根据价格表构建可复用的价格索引"""
+        price_index = PriceIndex(price_df)
+        logger.info(f"价格索引构建完成，共{len(price_index)}个商品编码")
+        return price_index
+
+    def match_prices(self, delivery_df: pd.DataFrame,
+                     price_source: Union[pd.DataFrame, PriceIndex]) -> Tuple[pd.DataFrame, Dict]:
+        """匹配送货明细和价格表数据，price_source 可传入价格表或预先构建的 PriceIndex"""
         try:
             # 创建结果DataFrame
             result_df = delivery_df.copy()
             
-            # 创建价格查找字典
-            price_dict = price_df.set_index('商品编码')['单价'].to_dict()
+            # 获取价格索引（批量匹配时可预先构建以复用）
+            if isinstance(price_source, PriceIndex):
+                price_index = price_source
+            else:
+                price_index = PriceIndex(price_source)
             
             # 添加单价列
-            result_df['单价'] = result_df['商品编码'].map(price_dict)
+            result_df['单价'] = price_index.lookup(result_df['商品编码'])
             
             # 计算金额
             result_df['金额'] = result_df['数量'] * result_df['单价']
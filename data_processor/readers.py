@@ -0,0 +1,113 @@
+import os
+import importlib.util
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+from ..utils.logger import logger
+
+class TableReader:
+    """表格读取后端，按文件格式自动选择可用的最快引擎"""
+
+    # 各格式的候选引擎，按速度从快到慢排列；未列出的格式交给 pandas 自动识别
+    ENGINES: Dict[str, List[str]] = {
+        '.xlsx': ['calamine', 'openpyxl'],
+        '.xlsm': ['calamine', 'openpyxl'],
+        '.xls': ['calamine', 'xlrd'],
+        '.csv': ['pyarrow', 'c'],
+    }
+
+    # 引擎所依赖的模块
+    ENGINE_MODULES: Dict[str, Optional[str]] = {
+        'calamine': 'python_calamine',
+        'openpyxl': 'openpyxl',
+        'xlrd': 'xlrd',
+        'pyarrow': 'pyarrow',
+        'c': None,
+    }
+
+    # CSV 依次尝试的编码，中文版 Excel 导出的 CSV 通常为 GBK
+    CSV_ENCODINGS: List[str] = ['utf-8-sig', 'gb18030']
+
+    # 商品编码统一按文本读取，避免丢失前导零，并保证各格式读出的编码类型一致
+    DTYPES: Dict[str, type] = {'商品编码': str}
+
+    def __init__(self):
+        self._available: Dict[str, bool] = {}
+
+    def is_available(self, engine: str) -> bool:
+        """检查引擎是否可用"""
+        if engine not in self._available:
+            module = self.ENGINE_MODULES.get(engine)
+            available = module is None or importlib.util.find_spec(module) is not None
+            # pandas 2.2 起才支持 calamine 引擎
+            if engine == 'calamine' and available:
+                major, minor = (int(part) for part in pd.__version__.split('.')[:2])
+                available = (major, minor) >= (2, 2)
+            self._available[engine] = available
+        return self._available[engine]
+
+    def get_engines(self, file_path: str) -> List[str]:
+        """获取文件格式对应的可用引擎列表，未知格式返回空列表"""
+        ext = os.path.splitext(file_path)[1].lower()
+        return [engine for engine in self.ENGINES.get(ext, []) if self.is_available(engine)]
+
+    def read(self, file_path: str, sheet_name: str) -> Tuple[pd.DataFrame, str]:
+        """读取表格文件，返回数据及所使用的引擎"""
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext == '.csv':
+            return self._read_csv(file_path)
+
+        for engine in self.get_engines(file_path):
+            try:
+                df = pd.read_excel(file_path, sheet_name=sheet_name, engine=engine, dtype=self.DTYPES)
+            except ImportError as e:
+                self._available[engine] = False
+                logger.warning(f"读取引擎{engine}不可用，尝试下一个引擎: {str(e)}")
+                continue
+            except (ValueError, OSError):
+                # 工作表不存在、文件不存在等错误与引擎无关，直接抛出，避免重复读取
+                raise
+            except Exception as e:
+                # 扩展名与实际内容不符等格式错误，交给后续引擎处理
+                logger.warning(f"使用{engine}引擎读取失败，尝试下一个引擎: {str(e)}")
+                continue
+
+            logger.info(f"使用{engine}引擎读取文件: {os.path.basename(file_path)}")
+            return df, engine
+
+        # 最后由 pandas 根据文件内容自动选择引擎
+        with pd.ExcelFile(file_path) as excel_file:
+            df = excel_file.parse(sheet_name=sheet_name, dtype=self.DTYPES)
+            engine = excel_file.engine
+        logger.info(f"使用{engine}引擎读取文件: {os.path.basename(file_path)}")
+        return df, engine
+
+    def _read_csv(self, file_path: str) -> Tuple[pd.DataFrame, str]:
+        """读取CSV文件，依次尝试可用引擎和编码"""
+        engines = self.get_engines(file_path)
+        if not engines:
+            raise ImportError(f"没有可用于读取CSV文件的引擎，请安装: {', '.join(self.ENGINES['.csv'])}")
+
+        last_error: Optional[Exception] = None
+        for engine in engines:
+            for encoding in self.CSV_ENCODINGS:
+                try:
+                    df = pd.read_csv(file_path, engine=engine, encoding=encoding, dtype=self.DTYPES)
+                except UnicodeDecodeError as e:
+                    last_error = e
+                    continue
+                except ImportError as e:
+                    self._available[engine] = False
+                    logger.warning(f"读取引擎{engine}不可用，尝试下一个引擎: {str(e)}")
+                    last_error = e
+                    break
+                except OSError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"使用{engine}引擎读取失败，尝试下一个引擎: {str(e)}")
+                    last_error = e
+                    break
+
+                logger.info(f"使用{engine}引擎读取文件: {os.path.basename(file_path)}")
+                return df, engine
+
+        raise last_error
\ No newline at end of file
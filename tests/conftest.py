@@ -0,0 +1,42 @@
+import os
+import sys
+import tempfile
+import types
+
+import yaml
+
+# 仓库目录即 src 包（app.py 以 src.* 导入），在此注册以便从仓库根目录运行测试
+repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if 'src' not in sys.modules:
+    src_package = types.ModuleType('src')
+    src_package.__path__ = [repo_dir]
+    sys.modules['src'] = src_package
+
+# 配置和日志指向临时目录，避免依赖仓库外的 config/config.yaml
+test_dir = tempfile.mkdtemp(prefix='checklist-tests-')
+test_config = {
+    'paths': {
+        'export_dir': os.path.join(test_dir, 'export'),
+        'template_dir': os.path.join(test_dir, 'templates'),
+        'log_dir': os.path.join(test_dir, 'logs'),
+    },
+    'templates': {
+        'price_template': {
+            'sheet_name': '价格表',
+            'required_fields': ['商品编码', '商品名称', '单价', '单位'],
+        },
+        'delivery_template': {
+            'sheet_name': '送货明细',
+            'required_fields': ['日期', '商品编码', '商品名称', '数量', '单位'],
+        },
+    },
+    'logging': {
+        'format': '{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}',
+        'level': 'INFO',
+        'file_pattern': 'test_{date}.log',
+    },
+}
+config_path = os.path.join(test_dir, 'config.yaml')
+with open(config_path, 'w', encoding='utf-8') as f:
+    yaml.safe_dump(test_config, f, allow_unicode=True)
+os.environ['CHECKLIST_CONFIG'] = config_path
\ No newline at end of file
@@ -0,0 +1,21 @@
+import pandas as pd
+import pytest
+
+from src.data_processor.excel_parser import ExcelParser
+
+
+def test_records_engine_per_file(tmp_path):
+    pytest.importorskip('openpyxl')
+    price_path = tmp_path / 'price.xlsx'
+    pd.DataFrame({
+        '商品编码': ['A001'], '商品名称': ['苹果'], '单价': [3.5], '单位': ['斤'],
+    }).to_excel(price_path, sheet_name='价格表', index=False, engine='openpyxl')
+    delivery_path = tmp_path / 'delivery.csv'
+    delivery_path.write_text('日期,商品编码,商品名称,数量,单位\n2024-01-05,A001,苹果,2,斤\n', encoding='utf-8')
+    parser = ExcelParser()
+
+    parser.parse_delivery_file(str(delivery_path))
+    parser.parse_price_file(str(price_path))
+
+    assert parser.engines['delivery'] in parser.reader.ENGINES['.csv']
+    assert parser.engines['price'] in parser.reader.ENGINES['.xlsx']
\ No newline at end of file
@@ -0,0 +1,93 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_processor.price_matcher import PriceIndex, PriceMatcher
+
+
+def legacy_prices(delivery_df, price_df):
+    """原先基于字典映射的匹配结果，作为对照"""
+    price_dict = price_df.set_index('商品编码')['单价'].to_dict()
+    return delivery_df['商品编码'].map(price_dict).astype('float64')
+
+
+@pytest.fixture
+def price_df():
+    return pd.DataFrame({
+        '商品编码': ['A001', 'A002', 'A001', 'A003'],
+        '单价': [1.0, 2.5, 1.5, 4.0],
+    })
+
+
+@pytest.fixture
+def delivery_df():
+    return pd.DataFrame({
+        '商品编码': ['A003', 'A001', 'X999', 'A002', 'A001'],
+        '数量': [1, 2, 3, 4, 5],
+    }, index=[10, 11, 12, 13, 14])
+
+
+def test_lookup_matches_legacy_mapping(price_df, delivery_df):
+    prices = PriceIndex(price_df).lookup(delivery_df['商品编码'])
+
+    pd.testing.assert_series_equal(prices, legacy_prices(delivery_df, price_df), check_names=False)
+    # 重复编码以最后一条为准，未匹配的为NaN
+    assert prices[11] == 1.5
+    assert np.isnan(prices[12])
+
+
+def test_lookup_with_mixed_str_and_int_codes():
+    price_df = pd.DataFrame({'商品编码': ['A001', 123, '123'], '单价': [1.0, 2.0, 3.0]}, dtype=object)
+    price_df['单价'] = price_df['单价'].astype('float64')
+    codes = pd.Series([123, '123', 'A001', 456], dtype=object)
+
+    prices = PriceIndex(price_df).lookup(codes)
+
+    assert list(prices[:3]) == [2.0, 3.0, 1.0]
+    assert np.isnan(prices[3])
+
+
+def test_empty_price_table(delivery_df):
+    price_index = PriceIndex(pd.DataFrame({'商品编码': [], '单价': []}))
+
+    prices = price_index.lookup(delivery_df['商品编码'])
+
+    assert len(price_index) == 0
+    assert prices.isna().all()
+    assert list(prices.index) == list(delivery_df.index)
+
+
+@pytest.mark.parametrize('dtype', ['Int64', 'Float64'])
+def test_nullable_prices(dtype):
+    price_df = pd.DataFrame({
+        '商品编码': ['A001', 'A002'],
+        '单价': pd.array([3, pd.NA], dtype=dtype),
+    })
+
+    prices = PriceIndex(price_df).lookup(pd.Series(['A001', 'A002']))
+
+    assert prices[0] == 3.0
+    assert np.isnan(prices[1])
+
+
+def test_pickle_round_trip(price_df, delivery_df):
+    price_index = pickle.loads(pickle.dumps(PriceIndex(price_df)))
+
+    prices = price_index.lookup(delivery_df['商品编码'])
+
+    pd.testing.assert_series_equal(prices, legacy_prices(delivery_df, price_df), check_names=False)
+
+
+def test_match_prices_with_prebuilt_index(price_df, delivery_df):
+    matcher = PriceMatcher()
+    price_index = matcher.build_index(price_df)
+
+    result_df, stats = matcher.match_prices(delivery_df, price_index)
+    expected_df, expected_stats = matcher.match_prices(delivery_df, price_df)
+
+    pd.testing.assert_frame_equal(result_df, expected_df)
+    assert stats == expected_stats
+    assert stats['matched_items'] == 4
+    assert stats['unmatched_items'] == 1
\ No newline at end of file
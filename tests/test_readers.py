@@ -0,0 +1,172 @@
+import pandas as pd
+import pytest
+
+from src.data_processor import readers
+from src.data_processor.price_matcher import PriceMatcher
+from src.data_processor.readers import TableReader
+
+
+class FormatError(Exception):
+    """模拟引擎无法识别文件格式时抛出的错误（如 xlrd 的 XLRDError）"""
+
+
+class FakeExcelFile:
+    """模拟 pandas 自动识别引擎的 ExcelFile"""
+
+    def __init__(self, file_path):
+        self.engine = 'openpyxl'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def parse(self, sheet_name, **kwargs):
+        return pd.DataFrame({'商品编码': ['00123']})
+
+
+def make_reader(monkeypatch, available):
+    reader = TableReader()
+    monkeypatch.setattr(reader, 'is_available', lambda engine: engine in available)
+    return reader
+
+
+def test_prefers_fastest_engine(monkeypatch):
+    calls = []
+
+    def fake_read_excel(file_path, sheet_name, engine, **kwargs):
+        calls.append(engine)
+        return pd.DataFrame()
+
+    monkeypatch.setattr(readers.pd, 'read_excel', fake_read_excel)
+    reader = make_reader(monkeypatch, {'calamine', 'openpyxl'})
+
+    _, engine = reader.read('price.xlsx', '价格表')
+
+    assert engine == 'calamine'
+    assert calls == ['calamine']
+
+
+def test_falls_back_on_import_error(monkeypatch):
+    calls = []
+
+    def fake_read_excel(file_path, sheet_name, engine, **kwargs):
+        calls.append(engine)
+        if engine == 'calamine':
+            raise ImportError("Missing optional dependency 'python-calamine'")
+        return pd.DataFrame()
+
+    monkeypatch.setattr(readers.pd, 'read_excel', fake_read_excel)
+    reader = make_reader(monkeypatch, {'calamine', 'xlrd'})
+
+    _, engine = reader.read('delivery.xls', '送货明细')
+
+    assert engine == 'xlrd'
+    assert calls == ['calamine', 'xlrd']
+
+
+def test_sheet_not_found_is_raised_without_fallback(monkeypatch):
+    calls = []
+
+    def fake_read_excel(file_path, sheet_name, engine, **kwargs):
+        calls.append(engine)
+        raise ValueError(f"Worksheet named '{sheet_name}' not found")
+
+    def fake_excel_file(file_path):
+        raise AssertionError('不应回退到自动识别')
+
+    monkeypatch.setattr(readers.pd, 'read_excel', fake_read_excel)
+    monkeypatch.setattr(readers.pd, 'ExcelFile', fake_excel_file)
+    reader = make_reader(monkeypatch, {'calamine', 'openpyxl'})
+
+    with pytest.raises(ValueError, match='not found'):
+        reader.read('price.xlsx', '价格表')
+    assert calls == ['calamine']
+
+
+def test_falls_back_to_pandas_auto_detection(monkeypatch):
+    def fake_read_excel(file_path, sheet_name, engine, **kwargs):
+        raise FormatError('Excel xlsx file; not supported')
+
+    monkeypatch.setattr(readers.pd, 'read_excel', fake_read_excel)
+    monkeypatch.setattr(readers.pd, 'ExcelFile', FakeExcelFile)
+    reader = make_reader(monkeypatch, {'xlrd'})
+
+    df, engine = reader.read('report.xls', '送货明细')
+
+    assert engine == 'openpyxl'
+    assert list(df['商品编码']) == ['00123']
+
+
+def test_raises_when_no_engine_installed(monkeypatch):
+    def fake_excel_file(file_path):
+        raise ImportError("Missing optional dependency 'openpyxl'")
+
+    monkeypatch.setattr(readers.pd, 'ExcelFile', fake_excel_file)
+    reader = make_reader(monkeypatch, set())
+
+    with pytest.raises(ImportError):
+        reader.read('price.xlsx', '价格表')
+
+
+def test_csv_raises_when_no_engine_available(monkeypatch):
+    reader = make_reader(monkeypatch, set())
+
+    with pytest.raises(ImportError, match='CSV'):
+        reader.read('delivery.csv', '送货明细')
+
+
+def test_csv_keeps_code_as_text_and_reads_gbk(tmp_path):
+    file_path = tmp_path / 'delivery.csv'
+    file_path.write_bytes('商品编码,商品名称\n00123,苹果\n'.encode('gbk'))
+    reader = TableReader()
+
+    df, engine = reader.read(str(file_path), '送货明细')
+
+    assert list(df['商品编码']) == ['00123']
+    assert list(df['商品名称']) == ['苹果']
+    assert engine in TableReader.ENGINES['.csv']
+
+def test_reads_real_xlsx_file(tmp_path):
+    pytest.importorskip('openpyxl')
+    file_path = tmp_path / 'price.xlsx'
+    pd.DataFrame({'商品名称': ['苹果', '香蕉'], '单价': [3.5, 2.0]}).to_excel(
+        file_path, sheet_name='价格表', index=False, engine='openpyxl')
+    reader = TableReader()
+
+    df, engine = reader.read(str(file_path), '价格表')
+
+    assert engine in TableReader.ENGINES['.xlsx']
+    assert list(df['商品名称']) == ['苹果', '香蕉']
+    assert list(df['单价']) == [3.5, 2.0]
+
+def test_csv_and_xlsx_codes_match(tmp_path):
+    pytest.importorskip('openpyxl')
+    price_path = tmp_path / 'price.xlsx'
+    pd.DataFrame({'商品编码': [123, 456], '单价': [3.5, 2.0]}).to_excel(
+        price_path, sheet_name='价格表', index=False, engine='openpyxl')
+    delivery_path = tmp_path / 'delivery.csv'
+    delivery_path.write_text('商品编码,数量\n123,2\n456,1\n', encoding='utf-8')
+    reader = TableReader()
+
+    price_df, _ = reader.read(str(price_path), '价格表')
+    delivery_df, _ = reader.read(str(delivery_path), '送货明细')
+    result_df, stats = PriceMatcher().match_prices(delivery_df, price_df)
+
+    assert list(price_df['商品编码']) == ['123', '456']
+    assert stats['matched_items'] == 2
+    assert list(result_df['金额']) == [7.0, 2.0]
+
+def test_xls_named_xlsx_falls_back_to_auto_detection(monkeypatch, tmp_path):
+    pytest.importorskip('openpyxl')
+    pytest.importorskip('xlrd')
+    file_path = tmp_path / 'report.xls'
+    pd.DataFrame({'商品名称': ['苹果']}).to_excel(
+        file_path, sheet_name='送货明细', index=False, engine='openpyxl')
+    reader = make_reader(monkeypatch, {'xlrd'})
+
+    df, engine = reader.read(str(file_path), '送货明细')
+
+    assert engine == 'openpyxl'
+    assert list(df['商品名称']) == ['苹果']
\ No newline at end of file
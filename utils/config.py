@@ -16,9 +16,9 @@ class Config:
             self.load_config()
 
     def load_config(self) -> None:
-        """加载配置文件"""
-        config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                                 'config', 'config.yaml')
+        """加载配置文件，可通过环境变量 CHECKLIST_CONFIG 指定配置文件路径"""
+        config_path = os.environ.get('CHECKLIST_CONFIG') or os.path.join(
+            os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'config', 'config.yaml')
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
                 self._config = yaml.safe_load(f)